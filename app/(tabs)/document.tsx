@@ -15,9 +15,7 @@ import * as FileSystem from 'expo-file-system';
 import { supabase } from '@/lib/supabase';
 import { checkShouldShowDocumentModal } from '@/context/DocumentModalContext';
 import { Camera } from 'expo-camera';
-
-// Define API Base URL (TODO: Move to central config/env)
-const API_BASE_URL = 'REDACTED_API_URL'; // Hardcoded production URL
+import { API_BASE_URL } from '@/constants/Config';
 
 // --- Constants based on Spec ---
 const PAGE_PADDING_HORIZONTAL = 24;
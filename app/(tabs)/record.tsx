@@ -5,6 +5,7 @@ import { SafeAreaView } from 'react-native-safe-area-context';
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { StatusBar } from 'expo-status-bar';
 import { Audio } from 'expo-av';
+import * as FileSystem from 'expo-file-system';
 import AppHeader from '@/components/AppHeader';
 import { useRouter } from 'expo-router';
 import { AudioWaveform } from '@/components/AudioWaveform';
@@ -13,12 +14,41 @@ import { useAuth } from '../../context/auth';
 import { deleteRecording } from '../../services/recordingService';
 import { supabase } from '@/lib/supabase';
 import { useUserProfile } from '@/hooks/useUserProfile';
+import { API_BASE_URL } from '@/constants/Config';
 import { RealtimeChannel } from '@supabase/supabase-js';
 
 // --- Configuration ---
-// TODO: Move this to a config file or environment variable
-// const API_BASE_URL = 'http://172.31.231.222:3000'; // Use the provided IP and default port
-const API_BASE_URL = 'REDACTED_API_URL'; // Hardcoded production URL
+
+// Reject recordings above this size before any upload work starts.
+const MAX_UPLOAD_BYTES = 50 * 1024 * 1024; // 50 MB
+
+// Recording options are identical for every recording, so build them once at
+// module scope instead of re-creating the object on each startRecording call.
+const RECORDING_OPTIONS: Audio.RecordingOptions = {
+  android: {
+    extension: '.m4a',
+    outputFormat: Audio.AndroidOutputFormat.MPEG_4,
+    audioEncoder: Audio.AndroidAudioEncoder.AAC,
+    sampleRate: 16000,
+    numberOfChannels: 1,
+    bitRate: 128000,
+  },
+  ios: {
+    extension: '.wav',
+    outputFormat: Audio.IOSOutputFormat.LINEARPCM,
+    audioQuality: Audio.IOSAudioQuality.MAX,
+    sampleRate: 16000,
+    numberOfChannels: 1,
+    bitRate: 128000,
+    linearPCMBitDepth: 16,
+    linearPCMIsBigEndian: false,
+    linearPCMIsFloat: false,
+  },
+  web: {
+    mimeType: 'audio/webm',
+    bitsPerSecond: 128000,
+  }
+};
 
 // --- Types ---
 // Define Recording type based on backend structure
@@ -160,40 +190,31 @@ const categorizeRecording = (recording: Recording): Recording => {
   }
 };
 
+// Status display info - shared constants so every list item reuses the same
+// objects instead of allocating a fresh one per call on each render.
+const STATUS_COMPLETED = { color: '#FFFFFF', icon: 'check-circle', backgroundColor: '#10B981' };
+const STATUS_IN_PROGRESS = { color: '#FFFFFF', icon: 'progress-clock', backgroundColor: '#EAB308' }; // Changed to yellow
+const STATUS_FAILED = { color: '#FFFFFF', icon: 'alert-circle', backgroundColor: '#EF4444' };
+const STATUS_UNKNOWN = { color: '#FFFFFF', icon: 'clock-outline', backgroundColor: '#6B7280' };
+
 // Get status information for a recording - Update to use shorter display labels
 const getRecordingStatus = (status: string): { color: string; icon: string; backgroundColor: string } => {
   switch (status) {
     case 'completed':
-      return { 
-        color: '#FFFFFF', 
-        icon: 'check-circle', 
-        backgroundColor: '#10B981' 
-      };
+      return STATUS_COMPLETED;
     case 'processing':
     case 'transcribing_completed':
     case 'queued':
     case 'pending_upload':
     case 'uploaded':
-      return { 
-        color: '#FFFFFF', 
-        icon: 'progress-clock', 
-        backgroundColor: '#EAB308' // Changed to yellow
-      };
+      return STATUS_IN_PROGRESS;
     case 'failed':
     case 'transcription_failed':
     case 'analysis_failed':
     case 'download_failed':
-      return { 
-        color: '#FFFFFF', 
-        icon: 'alert-circle', 
-        backgroundColor: '#EF4444' 
-      };
+      return STATUS_FAILED;
     default:
-      return { 
-        color: '#FFFFFF', 
-        icon: 'clock-outline', 
-        backgroundColor: '#6B7280' 
-      };
+      return STATUS_UNKNOWN;
   }
 };
 
@@ -886,33 +907,6 @@ function RecordScreenContent() {
         throw new Error(`Failed to get upload URL: ${error.message}`);
       }
       
-      // Define recording options for all platforms to avoid the error
-      const recordingOptions: Audio.RecordingOptions = {
-        android: {
-          extension: '.m4a',
-          outputFormat: Audio.AndroidOutputFormat.MPEG_4,
-          audioEncoder: Audio.AndroidAudioEncoder.AAC,
-          sampleRate: 16000,
-          numberOfChannels: 1,
-          bitRate: 128000,
-        },
-        ios: {
-          extension: '.wav',
-          outputFormat: Audio.IOSOutputFormat.LINEARPCM,
-          audioQuality: Audio.IOSAudioQuality.MAX,
-          sampleRate: 16000,
-          numberOfChannels: 1,
-          bitRate: 128000,
-          linearPCMBitDepth: 16,
-          linearPCMIsBigEndian: false,
-          linearPCMIsFloat: false,
-        },
-        web: {
-          mimeType: 'audio/webm',
-          bitsPerSecond: 128000,
-        }
-      };
-
       // Set audio mode for iOS
       await Audio.setAudioModeAsync({
         allowsRecordingIOS: true,
@@ -920,7 +914,7 @@ function RecordScreenContent() {
       });
 
       const { recording } = await Audio.Recording.createAsync(
-        recordingOptions,
+        RECORDING_OPTIONS,
         (status) => {
           // Update audio level for visualization (optional)
           if (status.isRecording) {
@@ -980,33 +974,56 @@ function RecordScreenContent() {
       }
       console.log(`Recording stopped. URI: ${recordingUri}, Duration: ${durationSeconds}s`);
 
-      // Fetch the blob from the URI
-      const blobResponse = await fetch(recordingUri);
-      const blob = await blobResponse.blob();
+      // Check the file size up front so oversized recordings fail fast with a
+      // clear message instead of timing out partway through the upload.
+      if (Platform.OS !== 'web') {
+        const fileInfo = await FileSystem.getInfoAsync(recordingUri, { size: true });
+        if (fileInfo.exists && fileInfo.size > MAX_UPLOAD_BYTES) {
+          const sizeMb = Math.round(fileInfo.size / (1024 * 1024));
+          throw new Error(`Recording is too large to upload (${sizeMb} MB, limit ${MAX_UPLOAD_BYTES / (1024 * 1024)} MB).`);
+        }
+      }
 
-      // Upload the blob to the signed URL (use the stored URL)
+      // Upload to the signed URL (use the stored URL)
       console.log('Uploading to signed URL...');
       setUploadProgress(0);
-      
+
       // Determine the correct content type based on platform
       const contentType = Platform.select({
         android: 'audio/mp4',
         ios: 'audio/wav',
-        web: blob.type || 'audio/webm',
+        web: 'audio/webm',
         default: 'audio/wav',
       });
-      
+
       console.log(`Using content type: ${contentType} for upload`);
-      
-      const uploadResponseS3 = await fetch(uploadUrl, {
-        method: 'PUT',
-        headers: { 'Content-Type': contentType },
-        body: blob,
-      });
 
-      if (!uploadResponseS3.ok) {
-        const errorText = await uploadResponseS3.text();
-        throw new Error(`Upload failed: ${uploadResponseS3.status} ${uploadResponseS3.statusText} - ${errorText}`);
+      if (Platform.OS === 'web') {
+        // expo-file-system is not available on web, so fetch the blob from the URI
+        const blobResponse = await fetch(recordingUri);
+        const blob = await blobResponse.blob();
+
+        const uploadResponseS3 = await fetch(uploadUrl, {
+          method: 'PUT',
+          headers: { 'Content-Type': blob.type || contentType },
+          body: blob,
+        });
+
+        if (!uploadResponseS3.ok) {
+          const errorText = await uploadResponseS3.text();
+          throw new Error(`Upload failed: ${uploadResponseS3.status} ${uploadResponseS3.statusText} - ${errorText}`);
+        }
+      } else {
+        // Stream the file from disk instead of loading the whole recording
+        // into memory as a blob first - long recordings can be tens of MB.
+        const uploadResult = await FileSystem.uploadAsync(uploadUrl, recordingUri, {
+          httpMethod: 'PUT',
+          headers: { 'Content-Type': contentType },
+        });
+
+        if (uploadResult.status < 200 || uploadResult.status >= 300) {
+          throw new Error(`Upload failed: ${uploadResult.status} - ${uploadResult.body}`);
+        }
       }
       console.log(`Upload successful for ${recordingId}. Updating status...`);
       setUploadProgress(100);
@@ -1063,6 +1080,16 @@ function RecordScreenContent() {
   };
 
   // --- UI Filtering and Rendering ---
+  // Count each category in a single pass instead of filtering the full list
+  // once per tab label on every render.
+  const categoryCounts = useMemo(() => {
+    const counts = { Appointment: 0, Reminder: 0, Other: 0 };
+    recordings.forEach(recording => {
+      counts[recording.category || 'Other'] += 1;
+    });
+    return counts;
+  }, [recordings]);
+
   const filteredRecordings = useMemo(() => {
     // First filter by search query
     let filtered = recordings;
@@ -1210,9 +1237,9 @@ function RecordScreenContent() {
                 onValueChange={setActiveFilter}
                 buttons={[
                   { value: 'all', label: `All (${recordings.length})` },
-                  { value: 'appointments', label: `Appointments (${recordings.filter(r => r.category === 'Appointment').length})` },
-                  { value: 'reminders', label: `Reminders (${recordings.filter(r => r.category === 'Reminder').length})` },
-                  { value: 'others', label: `Others (${recordings.filter(r => r.category === 'Other').length})` }
+                  { value: 'appointments', label: `Appointments (${categoryCounts.Appointment})` },
+                  { value: 'reminders', label: `Reminders (${categoryCounts.Reminder})` },
+                  { value: 'others', label: `Others (${categoryCounts.Other})` }
                 ]}
                 style={styles.segmentButtons}
               />
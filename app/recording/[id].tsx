@@ -13,6 +13,7 @@ import { Audio } from 'expo-av';
 import * as DocumentPicker from 'expo-document-picker';
 import { useSupabase } from '@/context/SupabaseProvider';
 import * as FileSystem from 'expo-file-system';
+import { API_BASE_URL } from '@/constants/Config';
 
 interface Medicine {
   id: number;
@@ -229,8 +230,6 @@ const createStyles = (theme: any) => StyleSheet.create({
   },
 });
 
-const API_BASE_URL = 'REDACTED_API_URL'; // Hardcoded production URL
-
 export default function RecordingDetailScreen() {
   const theme = useTheme();
   const styles = createStyles(theme);
@@ -9,8 +9,7 @@ import { useRouter, useNavigation } from 'expo-router';
 import * as Haptics from 'expo-haptics';
 import { useAuth } from '../context/auth';
 import { WebView } from 'react-native-webview';
-
-const API_BASE_URL = 'REDACTED_API_URL'; // Hardcoded production URL
+import { API_BASE_URL } from '../constants/Config';
 
 interface DocumentDetailsProps {
   document: DocumentInfo;
@@ -0,0 +1,4 @@
+// Central app configuration.
+// Reads EXPO_PUBLIC_API_URL (set in eas.json / .env per build profile) and
+// falls back to the production URL so existing builds keep working.
+export const API_BASE_URL = process.env.EXPO_PUBLIC_API_URL || 'REDACTED_API_URL';
@@ -4,8 +4,17 @@ import { createClient } from '@supabase/supabase-js';
 import { Platform, Linking } from 'react-native';
 import * as WebBrowser from 'expo-web-browser';
 
-const supabaseUrl = process.env.EXPO_PUBLIC_SUPABASE_URL!; // Reverted to use env variable
-const supabaseAnonKey = process.env.EXPO_PUBLIC_SUPABASE_ANON_KEY!; // <<< Left as env variable - PLEASE REPLACE MANUALLY if not using .env
+const supabaseUrl = process.env.EXPO_PUBLIC_SUPABASE_URL; // Reverted to use env variable
+const supabaseAnonKey = process.env.EXPO_PUBLIC_SUPABASE_ANON_KEY; // <<< Left as env variable - PLEASE REPLACE MANUALLY if not using .env
+
+// Fail fast at startup if the environment is missing. Otherwise createClient
+// silently accepts undefined and every auth/data call fails later with
+// confusing request-time errors.
+if (!supabaseUrl || !supabaseAnonKey) {
+  throw new Error(
+    'Supabase is not configured: EXPO_PUBLIC_SUPABASE_URL and EXPO_PUBLIC_SUPABASE_ANON_KEY must be set (see eas.json / .env).'
+  );
+}
 
 // Memory fallback for server-side rendering
 const memoryStorage = new Map<string, string>();
@@ -7,6 +7,7 @@ import {
   AuthorizationError,
   handleError // We might not use handleError directly if fetch handling is custom
 } from '../utils/errors';
+import { API_BASE_URL } from '../constants/Config';
 
 // Placeholder for Recording type - Define based on actual API response
 export interface Recording {
@@ -37,9 +38,28 @@ export interface Recording {
   // Add any other relevant fields from your backend API
 }
 
-// API base URL
-// TODO: Consider moving this to a configuration file or environment variable
-const API_BASE_URL = 'REDACTED_API_URL'; 
+// How long to wait before aborting a request. A hung request would otherwise
+// keep spinners/disabled buttons stuck indefinitely on the calling screen.
+const REQUEST_TIMEOUT_MS = 30 * 1000;
+
+/**
+ * fetch wrapper that aborts the request after REQUEST_TIMEOUT_MS and maps the
+ * abort to a NetworkError so callers handle it like any other network failure.
+ */
+async function fetchWithTimeout(url: string, init: RequestInit, context: string): Promise<Response> {
+  const controller = new AbortController();
+  const timer = setTimeout(() => controller.abort(), REQUEST_TIMEOUT_MS);
+  try {
+    return await fetch(url, { ...init, signal: controller.signal });
+  } catch (error: any) {
+    if (error?.name === 'AbortError') {
+      throw new NetworkError(error, `The server took too long to respond in ${context}. Please try again.`);
+    }
+    throw error;
+  } finally {
+    clearTimeout(timer);
+  }
+}
 
 /**
  * Helper to process fetch response and throw appropriate errors.
@@ -128,10 +148,10 @@ export const getRecordingById = async (id: string, token: string): Promise<Recor
       'Content-Type': 'application/json'
     };
 
-    const response = await fetch(`${API_BASE_URL}/recordings/${id}`, {
+    const response = await fetchWithTimeout(`${API_BASE_URL}/recordings/${id}`, {
       method: 'GET',
-      headers: headers 
-    }); 
+      headers: headers
+    }, context);
 
     return await handleFetchResponse<Recording>(response, context);
 
@@ -160,10 +180,10 @@ export const deleteRecording = async (id: string, token: string): Promise<void>
       'Authorization': `Bearer ${token}`,
     };
 
-    const response = await fetch(`${API_BASE_URL}/recordings/${id}`, {
+    const response = await fetchWithTimeout(`${API_BASE_URL}/recordings/${id}`, {
       method: 'DELETE',
       headers: headers,
-    });
+    }, context);
 
     // For DELETE, a 204 No Content is typical success.
     // handleFetchResponse expects JSON by default for 200, so we handle 204 separately here for clarity,
@@ -206,10 +226,10 @@ export const retryTranscription = async (id: string, token: string): Promise<Rec
       'Content-Type': 'application/json'
     };
 
-    const response = await fetch(`${API_BASE_URL}/recordings/${id}/retry-transcription`, {
+    const response = await fetchWithTimeout(`${API_BASE_URL}/recordings/${id}/retry-transcription`, {
       method: 'POST',
       headers: headers
-    });
+    }, context);
 
     // Assuming POST returns 200 OK with the updated/new recording data
     return await handleFetchResponse<Recording>(response, context, 200);